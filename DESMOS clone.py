@@ -1,30 +1,79 @@
+import ast
+import functools
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import os
+import re
+import sys
+import tempfile
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk, messagebox
 
 import numpy as np
-import sympy as sp
 
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+# sympy (and the optional numba/numexpr) are imported on first use instead of
+# here: they are only needed once an equation is rendered, and sympy alone
+# noticeably delays the window appearing.
+
+# Past this many points, per-point text labels cost more than they help.
+LABEL_THRESHOLD = 50
+
+# 3D surface grid size: about one sample per SURFACE_PIXELS_PER_SAMPLE screen
+# pixels of the axes, clamped to [SURFACE_MIN_N, SURFACE_MAX_N] per side.
+SURFACE_PIXELS_PER_SAMPLE = 5
+SURFACE_MIN_N = 32
+SURFACE_MAX_N = 200
+
+# Compiled equations are written here as real modules so numba can cache
+# their machine code on disk between sessions.
+EXPR_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vector-visualizer"
+
+# Surfaces with at least this many samples are evaluated on the GPU when cupy
+# and a CUDA device are available; below it the host/device copies cost more
+# than they save.
+GPU_MIN_SAMPLES = 150 * 150
 
 
 # --------------------------
 # Helpers: parsing & plotting
 # --------------------------
 
-def _safe_sympy_expr(expr_str: str, symbols: dict):
+@functools.cache
+def _optional_import(name: str):
     """
-    Parse a math expression using sympy with a limited namespace.
-    Examples:
-      "sin(x)", "x**2 + 3", "sqrt(x**2 + y**2)"
+    Import an optional accelerator on first use, or return None if it is not
+    installed:
+      numba   - compiles equations to fused ufuncs
+      numexpr - chunked, multi-threaded evaluation of the 3D surface
+      cupy    - GPU evaluation of large 3D surfaces
     """
-    expr_str = expr_str.strip()
-    if not expr_str:
-        raise ValueError("Empty expression.")
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@functools.cache
+def _equation_symbols():
+    """The x and y symbols, created once rather than on every render."""
+    import sympy as sp
+
+    return sp.Symbol("x", real=True), sp.Symbol("y", real=True)
+
+
+@functools.cache
+def _sympy_namespace():
+    import sympy as sp
 
     # allow common functions/constants
-    local_dict = {
-        **symbols,
+    return {
         "pi": sp.pi,
         "e": sp.E,
         "sin": sp.sin,
@@ -40,9 +89,261 @@ def _safe_sympy_expr(expr_str: str, symbols: dict):
         "exp": sp.exp,
     }
 
+
+def _safe_sympy_expr(expr_str: str, symbols: dict):
+    """
+    Parse a math expression using sympy with a limited namespace.
+    Examples:
+      "sin(x)", "x**2 + 3", "sqrt(x**2 + y**2)"
+    """
+    expr_str = expr_str.strip()
+    if not expr_str:
+        raise ValueError("Empty expression.")
+
+    import sympy as sp
+
+    local_dict = {**symbols, **_sympy_namespace()}
+
     # sympify is generally safer than eval; still treat as untrusted input.
-    expr = sp.sympify(expr_str, locals=local_dict)
-    return sp.simplify(expr)
+    # No sp.simplify here: the result is only ever lambdified, and simplify's
+    # heuristic passes can take seconds on otherwise ordinary expressions.
+    return sp.sympify(expr_str, locals=local_dict)
+
+
+def _write_atomically(path: Path, text: str):
+    # Write to a temp file next to the target and rename it into place, so a
+    # crash or a second app instance never leaves a truncated file behind.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _load_as_module(scalar_f):
+    """
+    Write a "math"-backend lambdified function to a file in EXPR_CACHE_DIR and
+    import it from there. lambdify's own functions have no source file, which
+    stops numba's cache=True from working. Returns None if the directory is
+    not writable or the module cannot be loaded.
+    """
+    src = "from math import *\n\n\n" + inspect.getsource(scalar_f)
+    name = "expr_" + hashlib.sha1(src.encode()).hexdigest()[:16]
+    path = EXPR_CACHE_DIR / f"{name}.py"
+    try:
+        if not path.exists() or path.read_text() != src:
+            EXPR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _write_atomically(path, src)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        # numba re-imports the module by name when loading cached code
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module._lambdifygenerated
+    except Exception:
+        sys.modules.pop(name, None)
+        return None
+
+
+def _jit_vectorize(expr, args, dims: int):
+    """
+    Compile expr into a numba ufunc over args, or return None if numba is
+    missing or cannot handle the expression. The 3D surface uses the parallel
+    target; the 2D curve is too short to be worth the thread start-up.
+    Compiled code is cached on disk, so an expression seen in an earlier
+    session does not pay the JIT cost again.
+    """
+    numba = _optional_import("numba")
+    if numba is None:
+        return None
+
+    import sympy as sp
+
+    if dims == 2:
+        sigs = ["float64(float64)", "float32(float32)"]
+        target = "cpu"
+    else:
+        sigs = ["float64(float64,float64)", "float32(float32,float32)"]
+        target = "parallel"
+
+    try:
+        scalar_f = sp.lambdify(args, expr, "math", cse=True)
+    except Exception:
+        return None
+
+    # Prefer the disk-cached build; if that fails for any reason, compile in
+    # memory rather than giving up on numba for this expression.
+    module_f = _load_as_module(scalar_f)
+    if module_f is not None:
+        try:
+            return numba.vectorize(sigs, target=target, cache=True)(module_f)
+        except Exception:
+            pass
+
+    try:
+        return numba.vectorize(sigs, target=target)(scalar_f)
+    except Exception:
+        return None
+
+
+def _numexpr_lambdify(expr, args):
+    """
+    Lambdify expr with the numexpr backend, or return None if numexpr is
+    missing or the expression uses something numexpr cannot evaluate.
+    """
+    if _optional_import("numexpr") is None:
+        return None
+
+    import sympy as sp
+
+    # No cse=True: the numexpr printer emits a single expression and cannot
+    # handle the intermediate assignments cse introduces.
+    try:
+        f = sp.lambdify(args, expr, "numexpr")
+        # The printer accepts things numexpr.evaluate later rejects (sign, Max,
+        # erf, ...), so try it once on a tiny grid before trusting it.
+        probe = np.linspace(0.5, 1.5, 4, dtype=np.float32).reshape(2, 2)
+        f(probe, probe)
+        return f
+    except Exception:
+        return None
+
+
+def _surface_quads(X, Y, Z):
+    """
+    Build the quad vertices of a surface grid as one (k, 4, 3) array, the
+    same polygons plot_surface(rstride=1, cstride=1) would make, without its
+    generic striding path. Quads touching a non-finite value are dropped.
+    """
+    Z = np.broadcast_to(Z, X.shape)  # constant expressions give a scalar
+    V = np.stack([X, Y, Z], axis=-1)
+    verts = np.stack([V[:-1, :-1], V[:-1, 1:], V[1:, 1:], V[1:, :-1]], axis=2).reshape(-1, 4, 3)
+    return verts[np.isfinite(verts).all(axis=(1, 2))]
+
+
+# Fast-path grammar for the point/vector boxes. Input that matches is handed
+# to np.fromstring in one go; anything else (typos, or float() spellings like
+# "inf") goes through the item-by-item parsers below, which also produce the
+# precise error message.
+_NUM = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+
+
+def _tuple_pattern(dims: int) -> str:
+    return r"\s*" + r"\s*,\s*".join([_NUM] * dims) + r"\s*"
+
+
+def _list_pattern(item: str) -> str:
+    # Items separated by ';', allowing empty entries and a trailing ';'
+    return rf"[\s;]*{item}(?:\s*;[\s;]*{item})*[\s;]*"
+
+
+_POINTS_RE = {d: re.compile(_list_pattern(rf"\({_tuple_pattern(d)}\)")) for d in (2, 3)}
+_VECTORS_RE = {
+    d: re.compile(_list_pattern(rf"<{_tuple_pattern(d)}>(?:\s*@\({_tuple_pattern(d)}\))?"))
+    for d in (2, 3)
+}
+_MISSING_TAIL_RE = re.compile(r">(?!\s*@)")
+_SEPARATORS = str.maketrans("<>@();,", " " * 7)
+
+
+def _numbers(text: str, width: int):
+    return np.fromstring(text.translate(_SEPARATORS), sep=" ").reshape(-1, width)
+
+
+@functools.cache
+def _gpu_available() -> bool:
+    cp = _optional_import("cupy")
+    if cp is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _cupy_lambdify(expr, args):
+    """
+    Lambdify expr with the cupy backend, or return None if the expression
+    uses something cupy cannot evaluate.
+    """
+    import sympy as sp
+
+    try:
+        return sp.lambdify(args, expr, "cupy", cse=True)
+    except Exception:
+        return None
+
+
+# Polynomials in x/y are evaluated with numpy directly, so the common case
+# never touches sympy. Anything else (functions, pi, x**0.5, x/y, ...) is left
+# to sympy.
+_POLY_CHARS_RE = re.compile(r"[\sxy0-9+\-*/.()]+")
+MAX_POLY_DEGREE = 30
+
+
+def _poly_add(a, b, sign=1.0):
+    out = np.zeros((max(a.shape[0], b.shape[0]), max(a.shape[1], b.shape[1])))
+    out[:a.shape[0], :a.shape[1]] += a
+    out[:b.shape[0], :b.shape[1]] += sign * b
+    return out
+
+
+def _poly_mul(a, b):
+    out = np.zeros((a.shape[0] + b.shape[0] - 1, a.shape[1] + b.shape[1] - 1))
+    if max(out.shape) > MAX_POLY_DEGREE + 1:
+        raise ValueError("Degree too high for the polynomial fast path.")
+    for (i, j), c in np.ndenumerate(a):
+        if c:
+            out[i:i + b.shape[0], j:j + b.shape[1]] += c * b
+    return out
+
+
+def _poly_from_node(node, names):
+    """Coefficients c[i, j] of x**i * y**j for an ast node, or ValueError."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return np.array([[float(node.value)]])
+    if isinstance(node, ast.Name) and node.id in names:
+        return np.array([[0.0], [1.0]]) if node.id == "x" else np.array([[0.0, 1.0]])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        c = _poly_from_node(node.operand, names)
+        return -c if isinstance(node.op, ast.USub) else c
+    if isinstance(node, ast.BinOp):
+        a = _poly_from_node(node.left, names)
+        b = _poly_from_node(node.right, names)
+        if isinstance(node.op, ast.Add):
+            return _poly_add(a, b)
+        if isinstance(node.op, ast.Sub):
+            return _poly_add(a, b, sign=-1.0)
+        if isinstance(node.op, ast.Mult):
+            return _poly_mul(a, b)
+        if isinstance(node.op, ast.Div) and b.shape == (1, 1) and b[0, 0] != 0:
+            return a / b[0, 0]
+        if isinstance(node.op, ast.Pow) and b.shape == (1, 1):
+            power = b[0, 0]
+            if power == int(power) and 0 <= power <= MAX_POLY_DEGREE:
+                out = np.ones((1, 1))
+                for _ in range(int(power)):
+                    out = _poly_mul(out, a)
+                return out
+    raise ValueError("Not a polynomial.")
+
+
+def _polynomial_coefficients(expr_str: str, dims: int):
+    """
+    Return the coefficients c[i, j] of x**i * y**j if expr_str is a plain
+    polynomial in x (2D) or x and y (3D), otherwise None.
+    """
+    if not _POLY_CHARS_RE.fullmatch(expr_str):
+        return None
+
+    names = ("x",) if dims == 2 else ("x", "y")
+    try:
+        return _poly_from_node(ast.parse(expr_str.strip(), mode="eval").body, names)
+    except (SyntaxError, ValueError, OverflowError, RecursionError):
+        return None
 
 
 def parse_points(text: str, dims: int):
@@ -50,23 +351,27 @@ def parse_points(text: str, dims: int):
     Input examples:
       2D: (1,2); (0,0); (-3,4)
       3D: (1,2,3); (0,0,0)
+
+    Returns an (n, dims) float array.
     """
-    pts = []
     s = text.strip()
     if not s:
-        return pts
+        return np.empty((0, dims))
+
+    if _POINTS_RE[dims].fullmatch(s):
+        return _numbers(s, dims)
 
     parts = [p.strip() for p in s.split(";") if p.strip()]
-    for p in parts:
+    pts = np.empty((len(parts), dims), dtype=np.float64)
+    for i, p in enumerate(parts):
         if not (p.startswith("(") and p.endswith(")")):
             raise ValueError(f"Point must be like (a,b) or (a,b,c). Got: {p}")
         inner = p[1:-1].strip()
         nums = [n.strip() for n in inner.split(",")]
         if len(nums) != dims:
             raise ValueError(f"Point {p} must have {dims} numbers.")
-        vals = [float(n) for n in nums]
-        pts.append(vals)
-    return np.array(pts, dtype=float)
+        pts[i] = [float(n) for n in nums]
+    return pts
 
 
 def parse_vectors(text: str, dims: int):
@@ -78,14 +383,22 @@ def parse_vectors(text: str, dims: int):
     Meaning:
       - <vx,vy> is a vector from origin
       - <vx,vy>@(tx,ty) is vector with tail at (tx,ty)
+
+    Returns (tails, dirs), both (n, dims) float arrays.
     """
-    vecs = []
     s = text.strip()
     if not s:
-        return vecs
+        return np.empty((0, dims)), np.empty((0, dims))
+
+    if _VECTORS_RE[dims].fullmatch(s):
+        origin = "@(" + ",".join(["0"] * dims) + ")"
+        rows = _numbers(_MISSING_TAIL_RE.sub(">" + origin, s), 2 * dims)
+        return np.ascontiguousarray(rows[:, dims:]), np.ascontiguousarray(rows[:, :dims])
 
     parts = [p.strip() for p in s.split(";") if p.strip()]
-    for item in parts:
+    tails = np.zeros((len(parts), dims), dtype=np.float64)
+    dirs = np.empty((len(parts), dims), dtype=np.float64)
+    for i, item in enumerate(parts):
         if "@(" in item:
             vpart, tpart = item.split("@", 1)
             tail_str = tpart.strip()
@@ -99,7 +412,7 @@ def parse_vectors(text: str, dims: int):
         nums = [n.strip() for n in inner.split(",")]
         if len(nums) != dims:
             raise ValueError(f"Vector {vpart} must have {dims} numbers.")
-        v = np.array([float(n) for n in nums], dtype=float)
+        dirs[i] = [float(n) for n in nums]
 
         if tail_str:
             if not (tail_str.startswith("(") and tail_str.endswith(")")):
@@ -108,12 +421,9 @@ def parse_vectors(text: str, dims: int):
             tnums = [n.strip() for n in inner_t.split(",")]
             if len(tnums) != dims:
                 raise ValueError(f"Tail {tail_str} must have {dims} numbers.")
-            tail = np.array([float(n) for n in tnums], dtype=float)
-        else:
-            tail = np.zeros(dims, dtype=float)
+            tails[i] = [float(n) for n in tnums]
 
-        vecs.append((tail, v))
-    return vecs
+    return tails, dirs
 
 
 # --------------------------
@@ -183,6 +493,9 @@ class VectorVisualizerApp(tk.Tk):
         self.status = tk.StringVar(value="Ready.")
         ttk.Label(left, textvariable=self.status, foreground="#005").pack(anchor="w", pady=(10, 0))
 
+        # Compiled equations, keyed by (equation text, dims or "cupy")
+        self._lambdify_cache = {}
+
         # Matplotlib figure/canvas
         self.fig = Figure(figsize=(7.5, 6), dpi=100)
         self.ax = None
@@ -203,11 +516,23 @@ class VectorVisualizerApp(tk.Tk):
             self.ax = self.fig.add_subplot(111)
         self.ax.set_title(f"Vector Visualizer ({self.mode.get()})")
         self.ax.grid(True)
+
+        # Artists from the last render, updated in place while the mode stays the same
+        self._axes_mode = self.mode.get()
+        self._scatter_artist = None
+        self._quiver_artist = None
+        self._curve_artist = None
+        self._surface_artist = None
+        self._surface_extent = None
+        self._label_artists = []
+        self._last_eq = None
+
         self.canvas_draw_safe()
 
     def canvas_draw_safe(self):
+        # draw_idle lets Tk coalesce this with the draw at the end of render()
         try:
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception:
             pass
 
@@ -215,6 +540,121 @@ class VectorVisualizerApp(tk.Tk):
         self._reset_axes()
         self.status.set("Cleared.")
 
+    def _discard_artist(self, attr: str):
+        artist = getattr(self, attr)
+        if artist is not None:
+            artist.remove()
+            setattr(self, attr, None)
+
+    def _surface_resolution(self) -> int:
+        bbox = self.ax.get_window_extent()
+        n = int(min(bbox.width, bbox.height) / SURFACE_PIXELS_PER_SAMPLE)
+        return min(SURFACE_MAX_N, max(SURFACE_MIN_N, n))
+
+    def _compile_equation(self, eq_str: str, dims: int):
+        """
+        Return (expr, f) for the equation, where f is the lambdified callable
+        taking x (2D) or x, y (3D). Results are cached so re-renders that only
+        change points, vectors or the range skip sympy entirely. Plain
+        polynomials skip it altogether and come back with expr=None.
+        """
+        key = (eq_str, dims)
+        cached = self._lambdify_cache.get(key)
+        if cached is not None:
+            return cached
+
+        coeffs = _polynomial_coefficients(eq_str, dims)
+        if coeffs is not None:
+            if dims == 2:
+                c = coeffs[:, 0]
+                f = lambda xs: np.polynomial.polynomial.polyval(xs, c)
+            else:
+                f = lambda X, Y: np.polynomial.polynomial.polyval2d(X, Y, coeffs.astype(X.dtype))
+            self._lambdify_cache[key] = (None, f)
+            return None, f
+
+        import sympy as sp
+
+        x, y = _equation_symbols()
+        if dims == 2:
+            expr = _safe_sympy_expr(eq_str, {"x": x})
+            args = x
+        else:
+            expr = _safe_sympy_expr(eq_str, {"x": x, "y": y})
+            args = (x, y)
+
+        f = _jit_vectorize(expr, args, dims)
+        if f is None and dims == 3:
+            f = _numexpr_lambdify(expr, args)
+        # Without numba the 2D curve also stays on the numpy backend: wrapping
+        # the "math" lambdify in np.vectorize is a Python-level loop (an order
+        # of magnitude slower on 600 points) and raises on domain errors such
+        # as sqrt(-1) where numpy just returns nan.
+        if f is None:
+            f = sp.lambdify(args, expr, "numpy", cse=True)
+
+        self._lambdify_cache[key] = (expr, f)
+        return expr, f
+
+    def _evaluate_surface_on_gpu(self, eq_str: str, expr, rmin: float, rmax: float, n: int):
+        """
+        Evaluate the surface on an n x n grid with cupy and return Z as a
+        numpy array, or None if there is no usable GPU or the evaluation fails.
+        """
+        if expr is None or not _gpu_available():
+            return None
+
+        key = (eq_str, "cupy")
+        if key not in self._lambdify_cache:
+            self._lambdify_cache[key] = _cupy_lambdify(expr, _equation_symbols())
+        f_gpu = self._lambdify_cache[key]
+        if f_gpu is None:
+            return None
+
+        cp = _optional_import("cupy")
+        try:
+            g = cp.linspace(rmin, rmax, n, dtype=cp.float32)
+            GX, GY = cp.meshgrid(g, g)
+            return cp.asnumpy(f_gpu(GX, GY))
+        except Exception:
+            return None
+
+    def _plot_equation(self, eq_str: str, dims: int, rmin: float, rmax: float, n: int):
+        expr, f = self._compile_equation(eq_str, dims)
+
+        if dims == 2:
+            xs = np.linspace(rmin, rmax, n)
+            ys = f(xs)
+            if self._curve_artist is None:
+                self._curve_artist, = self.ax.plot(xs, ys, linewidth=2, color="C0")
+            else:
+                self._curve_artist.set_data(xs, ys)
+
+        else:
+            # float32 is plenty at screen resolution and halves the bytes
+            # moved through the evaluation and quad building.
+            xs = np.linspace(rmin, rmax, n, dtype=np.float32)
+            ys = np.linspace(rmin, rmax, n, dtype=np.float32)
+            X, Y = np.meshgrid(xs, ys)
+            Z = None
+            if n * n >= GPU_MIN_SAMPLES:
+                Z = self._evaluate_surface_on_gpu(eq_str, expr, rmin, rmax, n)
+            if Z is None:
+                Z = f(X, Y)
+            # Shading is baked in when the collection is built, so a
+            # new surface needs a new collection.
+            self._discard_artist("_surface_artist")
+            verts = _surface_quads(X, Y, Z)
+            if not len(verts):
+                # Nothing finite to draw (e.g. log of a negative everywhere)
+                self._surface_extent = np.empty((0, 3))
+                return
+            self._surface_artist = Poly3DCollection(
+                verts, facecolors="C0", shade=True, alpha=0.6, linewidth=0
+            )
+            self.ax.add_collection3d(self._surface_artist)
+            self._surface_extent = verts.reshape(-1, 3)
+
     def render(self):
         try:
             mode = self.mode.get()
@@ -225,63 +665,83 @@ class VectorVisualizerApp(tk.Tk):
             if rmin >= rmax:
                 raise ValueError("Range min must be less than range max.")
 
-            # Clear & set axes
-            self._reset_axes()
+            # Only rebuild the axes when the mode changes; otherwise the
+            # previous render's artists are updated or replaced one by one.
+            if self._axes_mode != mode:
+                self._reset_axes()
+
+            for label in self._label_artists:
+                label.remove()
+            self._label_artists = []
+
+            # What the 3D z-axis should autoscale to (x/y are fixed to the range)
+            extents = []
 
             # --- Points ---
             pts = parse_points(self.points_text.get("1.0", "end").strip(), dims)
-            if pts.size:
+            if not len(pts):
+                self._discard_artist("_scatter_artist")
+            elif self._scatter_artist is None:
                 if dims == 2:
-                    self.ax.scatter(pts[:, 0], pts[:, 1], s=35)
-                    for i, (x, y) in enumerate(pts):
-                        self.ax.text(x, y, f"P{i}", fontsize=9)
+                    self._scatter_artist = self.ax.scatter(pts[:, 0], pts[:, 1], s=35, color="C0")
                 else:
-                    self.ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], s=35)
-                    for i, (x, y, z) in enumerate(pts):
-                        self.ax.text(x, y, z, f"P{i}", fontsize=9)
+                    self._scatter_artist = self.ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], s=35, color="C0")
+            else:
+                self._scatter_artist.set_offsets(pts[:, :2])
+                if dims == 3:
+                    self._scatter_artist.set_3d_properties(pts[:, 2], "z")
+
+            if len(pts):
+                extents.append(pts)
+                if len(pts) <= LABEL_THRESHOLD:
+                    for i, p in enumerate(pts):
+                        self._label_artists.append(self.ax.text(*p, f"P{i}", fontsize=9, clip_on=True))
 
             # --- Vectors ---
-            vecs = parse_vectors(self.vectors_text.get("1.0", "end").strip(), dims)
-            for idx, (tail, v) in enumerate(vecs):
+            # Quiver caches its arrow geometry at creation, so it is replaced
+            # rather than updated; it is a single artist either way.
+            tails, dirs = parse_vectors(self.vectors_text.get("1.0", "end").strip(), dims)
+            self._discard_artist("_quiver_artist")
+            if len(tails):
+                # One quiver call for all arrows instead of one artist per vector
                 if dims == 2:
-                    self.ax.quiver(
-                        tail[0], tail[1], v[0], v[1],
+                    self._quiver_artist = self.ax.quiver(
+                        tails[:, 0], tails[:, 1], dirs[:, 0], dirs[:, 1],
                         angles="xy", scale_units="xy", scale=1
                     )
-                    self.ax.text(tail[0] + v[0], tail[1] + v[1], f"v{idx}", fontsize=9)
                 else:
-                    self.ax.quiver(
-                        tail[0], tail[1], tail[2],
-                        v[0], v[1], v[2],
+                    self._quiver_artist = self.ax.quiver(
+                        tails[:, 0], tails[:, 1], tails[:, 2],
+                        dirs[:, 0], dirs[:, 1], dirs[:, 2],
                         length=1.0, normalize=False
                     )
-                    self.ax.text(tail[0] + v[0], tail[1] + v[1], tail[2] + v[2], f"v{idx}", fontsize=9)
+
+                extents.append(tails)
+                if len(tails) <= LABEL_THRESHOLD:
+                    for idx, tip in enumerate(tails + dirs):
+                        self._label_artists.append(self.ax.text(*tip, f"v{idx}", fontsize=9, clip_on=True))
 
             # --- Equation ---
             eq_str = self.eq_var.get().strip()
-            if eq_str:
+            if not eq_str:
+                self._discard_artist("_curve_artist")
+                self._discard_artist("_surface_artist")
+                self._last_eq = None
+            else:
                 eq_str = eq_str.replace("y=", "").replace("z=", "").strip()
 
-                if dims == 2:
-                    x = sp.Symbol("x", real=True)
-                    expr = _safe_sympy_expr(eq_str, {"x": x})
-                    f = sp.lambdify(x, expr, "numpy")
-
-                    xs = np.linspace(rmin, rmax, 600)
-                    ys = f(xs)
-                    self.ax.plot(xs, ys, linewidth=2)
-
-                else:
-                    x, y = sp.Symbol("x", real=True), sp.Symbol("y", real=True)
-                    expr = _safe_sympy_expr(eq_str, {"x": x, "y": y})
-                    f = sp.lambdify((x, y), expr, "numpy")
+                # Point/vector-only edits leave the curve or surface exactly as
+                # it was, so skip the equation entirely when nothing it depends
+                # on has changed.
+                n = self._surface_resolution() if dims == 3 else 600
+                eq_key = (eq_str, dims, rmin, rmax, n)
+                eq_artist = self._curve_artist if dims == 2 else self._surface_artist
+                if eq_key != self._last_eq or eq_artist is None:
+                    self._plot_equation(eq_str, dims, rmin, rmax, n)
+                    self._last_eq = eq_key
 
-                    n = 80
-                    xs = np.linspace(rmin, rmax, n)
-                    ys = np.linspace(rmin, rmax, n)
-                    X, Y = np.meshgrid(xs, ys)
-                    Z = f(X, Y)
-                    self.ax.plot_surface(X, Y, Z, alpha=0.6, rstride=1, cstride=1, linewidth=0)
+                if dims == 3:
+                    extents.append(self._surface_extent)
 
             # --- Axis formatting ---
             if dims == 2:
@@ -291,6 +751,11 @@ class VectorVisualizerApp(tk.Tk):
                 self.ax.set_xlabel("x")
                 self.ax.set_ylabel("y")
             else:
+                # Artists kept from earlier renders would otherwise leave the
+                # z-limits stretched to data that is no longer shown.
+                xyz = np.concatenate(extents) if extents else np.empty((0, 3))
+                if len(xyz):
+                    self.ax.auto_scale_xyz(xyz[:, 0], xyz[:, 1], xyz[:, 2], had_data=False)
                 self.ax.set_xlim(rmin, rmax)
                 self.ax.set_ylim(rmin, rmax)
                 self.ax.set_zlabel("z")
@@ -298,7 +763,7 @@ class VectorVisualizerApp(tk.Tk):
                 self.ax.set_ylabel("y")
 
             self.status.set("Rendered.")
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
         except Exception as e:
             self.status.set("Error.")
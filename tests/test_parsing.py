@@ -0,0 +1,70 @@
+import importlib.util
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_spec = importlib.util.spec_from_file_location("desmos_clone", Path(__file__).parents[1] / "DESMOS clone.py")
+app = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(app)
+
+_NEVER = re.compile(r"(?!)")
+
+POINTS = [
+    ("(1,2); (0,0); (-3,4)", 2),
+    (" ( 1 , 2 ) ;; (3.5e-2,-.5); ", 2),
+    ("(1.,+2)", 2),
+    ("(1,2,3); (0,0,0)", 3),
+]
+
+VECTORS = [
+    ("<2,1>; <-1,2>@(1,1)", 2),
+    ("<1,2> @(3,4);", 2),
+    (" < 1 , 2 > @( 3 , 4 ) ", 2),
+    ("<1,2,3>@(0,0,0); <1,1,1>", 3),
+]
+
+
+@pytest.mark.parametrize("text, dims", POINTS)
+def test_points_fast_path_matches_item_parser(monkeypatch, text, dims):
+    assert app._POINTS_RE[dims].fullmatch(text.strip())
+    fast = app.parse_points(text, dims)
+    monkeypatch.setitem(app._POINTS_RE, dims, _NEVER)
+    np.testing.assert_array_equal(fast, app.parse_points(text, dims))
+
+
+@pytest.mark.parametrize("text, dims", VECTORS)
+def test_vectors_fast_path_matches_item_parser(monkeypatch, text, dims):
+    assert app._VECTORS_RE[dims].fullmatch(text.strip())
+    fast = app.parse_vectors(text, dims)
+    monkeypatch.setitem(app._VECTORS_RE, dims, _NEVER)
+    slow = app.parse_vectors(text, dims)
+    np.testing.assert_array_equal(fast[0], slow[0])
+    np.testing.assert_array_equal(fast[1], slow[1])
+
+
+def test_almost_valid_points_fail_fast():
+    text = "; ".join(["(12,34)"] * 200) + "; (1,"
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        app.parse_points(text, 2)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_almost_valid_vectors_fail_fast():
+    text = "; ".join(["<12,34>@(10,20)"] * 200) + "; <1,2"
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        app.parse_vectors(text, 2)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_polynomial_fast_path():
+    np.testing.assert_array_equal(app._polynomial_coefficients("x**2 + 3*x + 1", 2), [[1.0], [3.0], [1.0]])
+    assert app._polynomial_coefficients("sin(x)", 2) is None
+
+
+def test_deep_polynomial_falls_back_to_sympy():
+    assert app._polynomial_coefficients("+".join(["x"] * 1200), 2) is None
@@ -0,0 +1,63 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+_spec = importlib.util.spec_from_file_location("desmos_clone", Path(__file__).parents[1] / "DESMOS clone.py")
+app = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(app)
+
+
+def _surface_app():
+    # Only the state _plot_equation touches; no Tk window is needed.
+    a = object.__new__(app.VectorVisualizerApp)
+    a.fig = Figure()
+    a.ax = a.fig.add_subplot(111, projection="3d")
+    a._lambdify_cache = {}
+    a._surface_artist = None
+    a._surface_extent = None
+    return a
+
+
+def test_surface_quads_drop_nonfinite():
+    X, Y = np.meshgrid(np.arange(3.0), np.arange(3.0))
+    Z = X + Y
+    Z[0, 0] = np.nan
+    assert app._surface_quads(X, Y, Z).shape == (3, 4, 3)
+
+
+@pytest.mark.parametrize("eq, rmin, rmax", [
+    ("log(-1-x**2-y**2)", -5, 5),
+    ("1/(x-x)", -5, 5),
+    ("log(x+y)", -5, -1),
+])
+def test_all_nonfinite_surface_draws_nothing(eq, rmin, rmax):
+    a = _surface_app()
+    a._plot_equation(eq, 3, rmin, rmax, 32)
+    assert a._surface_artist is None
+    assert a._surface_extent.shape == (0, 3)
+    assert not a.ax.collections
+
+
+def test_finite_surface_is_added():
+    a = _surface_app()
+    a._plot_equation("x*y", 3, -1, 1, 32)
+    assert a._surface_artist in a.ax.collections
+    assert a._surface_extent.shape == (31 * 31 * 4, 3)
+
+
+@pytest.mark.skipif(app._optional_import("numexpr") is None, reason="numexpr not installed")
+@pytest.mark.parametrize("eq", ["sign(x)", "Max(x,y)", "Min(x,1)", "erf(x)", "gamma(x)", "factorial(x)"])
+def test_numexpr_lambdify_rejects_what_numexpr_cannot_evaluate(eq):
+    x, y = app._equation_symbols()
+    expr = app._safe_sympy_expr(eq, {"x": x, "y": y})
+    assert app._numexpr_lambdify(expr, (x, y)) is None
+
+
+@pytest.mark.parametrize("eq", ["sign(x)", "Max(x,y)", "Min(x,1)"])
+def test_compile_equation_falls_back_to_numpy(eq):
+    _, f = _surface_app()._compile_equation(eq, 3)
+    X, Y = np.meshgrid(np.linspace(-2, 2, 4), np.linspace(-2, 2, 4))
+    assert np.shape(f(X, Y)) == X.shape